@@ -156,6 +156,7 @@ async def run(corpus: Path, min_score: int, dry_run: bool, limit: int | None) ->
 
     driver = AsyncGraphDatabase.driver(settings.neo4j_uri, auth=(settings.neo4j_user, settings.neo4j_password_value))
     imported = 0
+    embeddings = None
     try:
         embeddings = create_embedding_service(neo4j_driver=driver, use_cache=True)
         async with driver.session() as session:
@@ -166,10 +167,12 @@ async def run(corpus: Path, min_score: int, dry_run: bool, limit: int | None) ->
                 vectors = await embeddings.embed_batch([c.content for c in batch])
                 for consolidation, vector in zip(batch, vectors, strict=True):
                     attach_embedding_provenance(consolidation, vector, embeddings)
-                    await repo.remember(consolidation)
-                    imported += 1
+                await repo.remember_many(batch)
+                imported += len(batch)
                 logger.info("Curated import progress", imported=imported, total=len(consolidations))
     finally:
+        if embeddings:
+            await embeddings.close()
         await driver.close()
     print(f"Imported {imported} curated memories as Consolidation nodes")
 
@@ -24,6 +24,9 @@ from memory_palace.services.memory_service import MemoryService
 setup_logging()
 logger = get_logger(__name__)
 
+_HUMAN_TURN_PATTERN = re.compile(r"^Human:\s*(.+?)(?=^(?:Assistant:|Human:|$))", re.MULTILINE | re.DOTALL)
+_ASSISTANT_TURN_PATTERN = re.compile(r"^Assistant:\s*(.+?)(?=^(?:Human:|Assistant:|$))", re.MULTILINE | re.DOTALL)
+
 
 def calculate_salience(content: str, is_highlighted: bool = False) -> float:
     """Calculate importance of a memory based on content patterns.
@@ -99,11 +102,8 @@ def parse_conversation_file(file_path: Path) -> list[dict[str, Any]]:
             logger.warning(f"Failed to parse {file_path} as JSON, trying text format")
 
     # Try text format with Human/Assistant markers
-    human_pattern = r"^Human:\s*(.+?)(?=^(?:Assistant:|Human:|$))"
-    assistant_pattern = r"^Assistant:\s*(.+?)(?=^(?:Human:|Assistant:|$))"
-
-    humans = re.findall(human_pattern, content, re.MULTILINE | re.DOTALL)
-    assistants = re.findall(assistant_pattern, content, re.MULTILINE | re.DOTALL)
+    humans = _HUMAN_TURN_PATTERN.findall(content)
+    assistants = _ASSISTANT_TURN_PATTERN.findall(content)
 
     for human, assistant in zip(humans, assistants, strict=False):
         turns.append({"user": human.strip(), "assistant": assistant.strip(), "timestamp": None, "metadata": {}})
@@ -25,6 +25,8 @@ from memory_palace.services.memory_service import MemoryService
 setup_logging()
 logger = get_logger(__name__)
 
+_USER_TURN_PATTERN = re.compile(r"### User\s*\n(.*?)(?=### Assistant|$)", re.DOTALL)
+_ASSISTANT_TURN_PATTERN = re.compile(r"### Assistant\s*\n(.*?)(?=### User|$)", re.DOTALL)
 
 # Tier configuration with Icelandic names and salience ranges
 TIER_CONFIG = {
@@ -104,7 +106,7 @@ def parse_memory_file(file_path: Path) -> dict:
         conv = sections["Original Conversation"]
 
         # Look for the first user message
-        user_match = re.search(r"### User\s*\n(.*?)(?=### Assistant|$)", conv, re.DOTALL)
+        user_match = _USER_TURN_PATTERN.search(conv)
         if user_match:
             user_content = user_match.group(1).strip()
 
@@ -114,7 +116,7 @@ def parse_memory_file(file_path: Path) -> dict:
             # Get content after </thinking> and before next ### User (if any)
             after_thinking = conv.split("</thinking>")[-1]
             # Look for ### Assistant after the thinking section
-            assistant_match = re.search(r"### Assistant\s*\n(.*?)(?=### User|$)", after_thinking, re.DOTALL)
+            assistant_match = _ASSISTANT_TURN_PATTERN.search(after_thinking)
             if assistant_match:
                 assistant_content = assistant_match.group(1).strip()
             else:
@@ -127,7 +129,7 @@ def parse_memory_file(file_path: Path) -> dict:
                     assistant_content = assistant_content.split("### User")[0].strip()
         else:
             # No thinking section, look for regular assistant response
-            assistant_match = re.search(r"### Assistant\s*\n(.*?)(?=### User|$)", conv, re.DOTALL)
+            assistant_match = _ASSISTANT_TURN_PATTERN.search(conv)
             if assistant_match:
                 assistant_content = assistant_match.group(1).strip()
 
@@ -44,15 +44,12 @@ async def main(threshold: float, dry_run: bool) -> None:
             """
         )
         repo = MemoryRepository(session)
-        unlinked = []
-        async for record in result:
-            memory = repo._validate_union_record(record["m"])
-            if memory is not None:
-                unlinked.append(memory)
+        unlinked = [memory for memory, _ in repo._validate_union_records(await result.data())]
 
         logger.info(f"Found {len(unlinked)} unlinked memories")
         if dry_run:
             print(f"DRY RUN: would attempt linking for {len(unlinked)} memories at threshold {threshold}")
+            await embeddings.close()
             await driver.close()
             return
 
@@ -67,6 +64,7 @@ async def main(threshold: float, dry_run: bool) -> None:
             if i % 50 == 0:
                 logger.info(f"Processed {i}/{len(unlinked)} ({edge_count} edges so far)")
 
+    await embeddings.close()
     await driver.close()
     print(f"Linked {linked_count}/{len(unlinked)} memories with {edge_count} new edges (threshold {threshold})")
 
@@ -59,7 +59,7 @@ async def rescue_messages(session: AsyncSession, now: float, dry_run: bool) -> i
                c.id AS conversation_id
         """
     )
-    messages = [dict(record) async for record in result]
+    messages = await result.data()
 
     rescued = 0
     for msg in messages:
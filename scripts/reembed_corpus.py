@@ -45,7 +45,7 @@ async def main(dry_run: bool) -> None:
                 "MATCH (m:Memory) WHERE m.content IS NOT NULL "
                 "RETURN m.id AS id, m.content AS content ORDER BY m.timestamp"
             )
-            rows = [dict(record) async for record in result]
+            rows = await result.data()
             logger.info("Corpus re-embedding plan", memories=len(rows), model=model, dimensions=dimensions)
 
             if dry_run:
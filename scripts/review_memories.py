@@ -4,6 +4,11 @@
 import re
 from pathlib import Path
 
+_SECTION_PATTERNS = {
+    section: re.compile(f"# {section}\n(.*?)(?=\n#|$)", re.DOTALL)
+    for section in ("What Happened", "Why This Matters", "Memorable Moments")
+}
+
 
 def parse_memory_file(file_path: Path) -> dict:
     """Parse a markdown memory file."""
@@ -22,8 +27,8 @@ def parse_memory_file(file_path: Path) -> dict:
 
     # Extract key sections
     sections = {}
-    for section in ["What Happened", "Why This Matters", "Memorable Moments"]:
-        match = re.search(f"# {section}\n(.*?)(?=\n#|$)", content, re.DOTALL)
+    for section, pattern in _SECTION_PATTERNS.items():
+        match = pattern.search(content)
         if match:
             sections[section] = match.group(1).strip()
 
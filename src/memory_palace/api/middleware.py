@@ -46,6 +46,8 @@ class _InvalidContentLength(ValueError):
 class _LimitedReceive:
     """Count body bytes without buffering or changing ASGI message boundaries."""
 
+    __slots__ = ("_max_body_bytes", "_receive", "_received_body_bytes")
+
     def __init__(self, receive: Receive, max_body_bytes: int) -> None:
         self._receive = receive
         self._max_body_bytes = max_body_bytes
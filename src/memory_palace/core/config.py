@@ -2,6 +2,7 @@
 
 from enum import StrEnum
 from ipaddress import ip_address
+from typing import Literal
 
 from pydantic import AnyHttpUrl, BaseModel, Field, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -66,6 +67,7 @@ class Settings(BaseSettings):
     # App config
     environment: Environment = Environment.DEVELOPMENT
     debug: bool = True
+    log_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO"
     public_base_url: AnyHttpUrl = AnyHttpUrl("http://localhost:8000")
     cors_allowed_origins: list[AnyHttpUrl] = Field(default_factory=lambda: [AnyHttpUrl("http://localhost:3000")])
     max_request_body_bytes: int = Field(default=1_048_576, ge=16_384, le=10_485_760)
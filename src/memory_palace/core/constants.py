@@ -37,6 +37,7 @@ RECALL_LIMIT_DEFAULT = 10
 RECALL_LIMIT_MAX = 50
 BATCH_SIZE_EMBEDDINGS = 50
 VECTOR_SEARCH_K_MULTIPLIER = 3  # Multiply limit by this for initial retrieval
+EMBEDDING_MEMO_SIZE = 512  # Recent embeddings kept in-process in front of the Neo4j cache
 
 # Graph traversal
 RELATIONSHIP_DEPTH_DEFAULT = 1
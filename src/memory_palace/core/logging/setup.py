@@ -13,6 +13,8 @@ from structlog.processors import CallsiteParameter, CallsiteParameterAdder
 from structlog.types import EventDict, Processor, WrappedLogger
 from structlog.typing import FilteringBoundLogger
 
+from memory_palace.core.config import settings
+
 
 def add_logfire_context(
     _logger: WrappedLogger,
@@ -37,7 +39,7 @@ def add_logfire_context(
     return event_dict
 
 
-def setup_logging() -> None:
+def setup_logging(level: int | None = None) -> None:
     """Set up application-wide logging with Logfire and structlog integration.
 
     Logfire is primarily configured via environment variables:
@@ -46,7 +48,16 @@ def setup_logging() -> None:
     - LOGFIRE_ENVIRONMENT: Environment (defaults to "development")
 
     This function configures structlog to work seamlessly with Logfire.
+
+    Args:
+        level: Minimum level emitted; defaults to settings.log_level (the
+            LOG_LEVEL env var, INFO unless set). Structlog calls below it
+            return before any processor runs, so filtered debug logging
+            stays cheap.
     """
+    if level is None:
+        level = logging.getLevelNamesMapping()[settings.log_level]
+
     # Common processors for structured logging
     processors: list[Processor] = [
         # Merge context from contextvars
@@ -77,6 +88,9 @@ def setup_logging() -> None:
     # Configure structlog
     structlog.configure(
         processors=processors,
+        # Drop below-level events before the processor chain (callsite lookup,
+        # timestamping, Logfire export) does any work
+        wrapper_class=structlog.make_filtering_bound_logger(level),
         # Use PrintLogger to avoid double logging with standard library
         logger_factory=structlog.PrintLoggerFactory(),
         # Cache logger instances
@@ -89,7 +103,7 @@ def setup_logging() -> None:
     logging.basicConfig(
         format="%(message)s",
         stream=sys.stdout,
-        level=logging.INFO,
+        level=level,
     )
 
     # Add structlog's ProcessorFormatter to standard logging
@@ -105,7 +119,7 @@ def setup_logging() -> None:
     # Apply to root logger
     root_logger = logging.getLogger()
     root_logger.handlers = [handler]
-    root_logger.setLevel(logging.INFO)
+    root_logger.setLevel(level)
 
 
 def instrument_libraries() -> None:
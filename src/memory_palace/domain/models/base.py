@@ -3,6 +3,7 @@ import typing
 from collections.abc import Mapping
 from datetime import UTC, datetime
 from enum import Enum, StrEnum
+from functools import cache
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -54,19 +55,28 @@ class GraphModel(BaseModel):
         # Fallback to class name
         return ["Memory", cls.__name__]
 
+    # Fixed per class, but consulted on every from_neo4j_record.
     @classmethod
-    def _datetime_fields(cls) -> set[str]:
+    @cache
+    def _datetime_fields(cls) -> frozenset[str]:
         """Field names whose annotation is datetime (or datetime | None)."""
         fields: set[str] = set()
         for name, info in cls.model_fields.items():
             annotation = info.annotation
             if annotation is datetime or datetime in typing.get_args(annotation):
                 fields.add(name)
-        return fields
+        return frozenset(fields)
 
     def to_neo4j_properties(self) -> dict:
-        """Convert to Neo4j-compatible property dict."""
+        """Convert to Neo4j-compatible property dict.
+
+        A ``None`` embedding is left out: recall paths project nodes without
+        their vector, and ``SET m += props`` would otherwise erase the stored one
+        when such a memory is written back.
+        """
         props = self.model_dump()
+        if props.get("embedding", ...) is None:
+            del props["embedding"]
 
         for key, value in props.items():
             if isinstance(value, UUID):
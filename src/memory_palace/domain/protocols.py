@@ -15,6 +15,8 @@ class EmbeddingService(Protocol):
 
     def get_model_dimensions(self) -> int: ...
 
+    async def close(self) -> None: ...
+
 
 @runtime_checkable
 class ClusteringService(Protocol):
@@ -1,8 +1,13 @@
+import asyncio
 import hashlib
+import time
+from collections import OrderedDict
 
 from neo4j import AsyncDriver, AsyncSession
 
-from memory_palace.core.decorators import with_session
+from memory_palace.core.base import ErrorLevel
+from memory_palace.core.constants import EMBEDDING_MEMO_SIZE
+from memory_palace.core.decorators import with_error_handling, with_session
 from memory_palace.infrastructure.neo4j.queries import CacheQueries
 
 
@@ -10,25 +15,72 @@ class EmbeddingCache:
     """Neo4j-backed cache for embedding vectors with model awareness.
 
     The cache tracks which model generated each embedding to prevent
-    serving stale embeddings when models are switched.
+    serving stale embeddings when models are switched. A small in-process
+    LRU sits in front of it so repeated query texts skip the round-trip.
+    Each copy keeps its Neo4j expiry, and hits served from it are still
+    counted on the cache node, in the background.
     """
 
     def __init__(self, driver: AsyncDriver) -> None:
         """Initialize cache with a driver instead of session for proper lifecycle."""
         self.driver = driver
+        # key -> (vector, expires_at epoch seconds); tuples so callers can't mutate it
+        self._recent: OrderedDict[str, tuple[tuple[float, ...], float]] = OrderedDict()
+        self._hit_tasks: set[asyncio.Task[None]] = set()
 
     @staticmethod
     def _cache_key(text: str, model: str) -> str:
         """Build a collision-resistant, model-scoped content key."""
         return hashlib.sha256(f"{model}::{text}".encode()).hexdigest()
 
-    @with_session()
-    async def get_cached(self, session: AsyncSession, text: str, model: str) -> list[float] | None:
+    def _remember_recent(self, key: str, embedding: list[float], expires_at: float) -> None:
+        self._recent[key] = (tuple(embedding), expires_at)
+        self._recent.move_to_end(key)
+        if len(self._recent) > EMBEDDING_MEMO_SIZE:
+            self._recent.popitem(last=False)
+
+    async def get_cached(self, text: str, model: str) -> list[float] | None:
         """Retrieve a cached embedding if available, not expired, and from the same model."""
+        key = self._cache_key(text, model)
+        if (entry := self._recent.get(key)) is not None:
+            vector, expires_at = entry
+            if expires_at > time.time():
+                self._recent.move_to_end(key)
+                task = asyncio.create_task(self._bump_hit(key, model))
+                self._hit_tasks.add(task)
+                task.add_done_callback(self._hit_tasks.discard)
+                return list(vector)
+            del self._recent[key]
+
+        fetched = await self._fetch(key, model)
+        if fetched is None:
+            return None
+        embedding, expires_at = fetched
+        self._remember_recent(key, embedding, expires_at)
+        return embedding
+
+    @with_session()
+    async def _fetch(self, session: AsyncSession, key: str, model: str) -> tuple[list[float], float] | None:
         query, _ = CacheQueries.get_cached_embedding()
-        result = await session.run(query, key=self._cache_key(text, model), model=model)
+        result = await session.run(query, key=key, model=model)
         record = await result.single()
-        return record["embedding"] if record else None
+        return (record["embedding"], record["expires_at"]) if record else None
+
+    async def _bump_hit(self, key: str, model: str) -> None:
+        # create_task needs a real coroutine, not the decorator's awaitable
+        await self._record_hit(key, model)
+
+    @with_error_handling(error_level=ErrorLevel.WARNING, reraise=False)
+    @with_session()
+    async def _record_hit(self, session: AsyncSession, key: str, model: str) -> None:
+        query, _ = CacheQueries.record_embedding_hit()
+        result = await session.run(query, key=key, model=model)
+        await result.consume()
+
+    async def aclose(self) -> None:
+        """Wait for background hit bumps so none outlive the driver."""
+        if self._hit_tasks:
+            await asyncio.gather(*self._hit_tasks, return_exceptions=True)
 
     @with_session()
     async def store(
@@ -40,12 +92,16 @@ class EmbeddingCache:
         dimensions: int,
     ) -> None:
         """Store an embedding in the cache with model metadata."""
+        key = self._cache_key(text, model)
         query, _ = CacheQueries.store_embedding()
-        await session.run(
+        result = await session.run(
             query,
-            key=self._cache_key(text, model),
+            key=key,
             model=model,
             embedding=embedding,
             dimensions=dimensions,
             text=text,
         )
+        record = await result.single()
+        if record is not None:
+            self._remember_recent(key, embedding, record["expires_at"])
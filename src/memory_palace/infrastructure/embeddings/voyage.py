@@ -371,5 +371,6 @@ class VoyageEmbeddingService:
             raise ValueError(f"Unknown Voyage embedding model: {self.model}") from exc
 
     async def close(self) -> None:
-        """Close the client connection."""
-        # Implement if needed for cleanup
+        """Release background work; call before closing the Neo4j driver."""
+        if self.cache:
+            await self.cache.aclose()
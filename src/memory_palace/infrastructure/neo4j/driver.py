@@ -178,6 +178,7 @@ def _vector_index_matches(record: Mapping[str, object], dimensions: int) -> bool
 
     configured_dimensions = index_config.get("vector.dimensions") or index_config.get("`vector.dimensions`")
     similarity = index_config.get("vector.similarity_function") or index_config.get("`vector.similarity_function`")
+    quantized = index_config.get("vector.quantization.enabled", index_config.get("`vector.quantization.enabled`"))
     return (
         record.get("type") == "VECTOR"
         and record.get("labelsOrTypes") == ["Memory"]
@@ -185,4 +186,5 @@ def _vector_index_matches(record: Mapping[str, object], dimensions: int) -> bool
         and configured_dimensions == dimensions
         and isinstance(similarity, str)
         and similarity.casefold() == "cosine"
+        and quantized is True
     )
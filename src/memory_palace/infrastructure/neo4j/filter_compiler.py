@@ -6,6 +6,8 @@ preventing SQL injection and supporting advanced operators.
 
 from __future__ import annotations
 
+from functools import lru_cache
+from itertools import count
 from typing import cast
 
 from pydantic import JsonValue
@@ -24,17 +26,25 @@ _FILTERABLE_FIELDS = frozenset(
 )
 _FILTER_ALIASES = frozenset({"m", "node"})
 
-_OPS = {
-    "lt": "<",
-    "lte": "<=",
-    "gt": ">",
-    "gte": ">=",
-    "ne": "<>",
-    "in": "IN",
-    "contains": "CONTAINS",
-    "startswith": "STARTS WITH",
-    "endswith": "ENDS WITH",
-    "overlap": "ANY",  # Special handling for list overlaps
+# A filter dict with its values stripped: each entry is (key, branch shapes)
+# for $or/$and groups, (key, None) for null checks, or (key, ()) for a
+# parameterized clause.
+type _FilterShape = tuple[tuple[str, tuple[_FilterShape, ...] | None], ...]
+
+# Clause templates keyed by operator; "eq" is the bare-field form. Each
+# clause is rendered with a single str.format call.
+_OP_TEMPLATES = {
+    "eq": "{alias}.{field} = {param}",
+    "lt": "{alias}.{field} < {param}",
+    "lte": "{alias}.{field} <= {param}",
+    "gt": "{alias}.{field} > {param}",
+    "gte": "{alias}.{field} >= {param}",
+    "ne": "{alias}.{field} <> {param}",
+    "in": "{alias}.{field} IN {param}",
+    "contains": "{alias}.{field} CONTAINS {param}",
+    "startswith": "{alias}.{field} STARTS WITH {param}",
+    "endswith": "{alias}.{field} ENDS WITH {param}",
+    "overlap": "ANY(x IN {param} WHERE x IN {alias}.{field})",
 }
 
 
@@ -46,6 +56,10 @@ def _param_name(base: str, idx: int) -> str:
 def compile_filters(filters: dict[str, JsonValue] | None, alias: str = "m") -> tuple[str, dict[str, JsonValue]]:
     """Compile filter dictionary into safe WHERE clause and parameters.
 
+    Thin wrapper over compile_conditions for callers that own the whole
+    WHERE clause. Queries that already have their own WHERE conditions
+    should use compile_conditions directly rather than stripping the prefix.
+
     Args:
         filters: Dictionary of filters supporting:
             - Simple equality: {"field": "value"}
@@ -67,87 +81,102 @@ def compile_filters(filters: dict[str, JsonValue] | None, alias: str = "m") -> t
         >>> compile_filters({"$or": [{"memory_type": "friend_utterance"}, {"memory_type": "claude_utterance"}]})
         ('WHERE (m.memory_type = $p_0 OR m.memory_type = $p_1)', {'p_0': 'friend_utterance', 'p_1': 'claude_utterance'})
     """
+    conditions, params = compile_conditions(filters, alias=alias)
+    return ("WHERE " + conditions if conditions else ""), params
+
+
+def compile_conditions(filters: dict[str, JsonValue] | None, alias: str = "m") -> tuple[str, dict[str, JsonValue]]:
+    """Compile filter dictionary into AND-joined conditions without a WHERE prefix.
+
+    Accepts the same filter syntax as compile_filters.
+
+    Returns:
+        Tuple of (conditions string, parameters dict); the string is empty
+        when there is nothing to filter on.
+    """
     alias = validate_identifier(alias, kind="alias", allowed=_FILTER_ALIASES)
 
     if not filters:
         return "", {}
 
-    params: dict[str, JsonValue] = {}
-    param_counter = [0]  # Use list to allow modification in nested function
-
-    def add_clause(expr: str, value: JsonValue) -> str:
-        """Add a clause with parameterized value."""
-        param_name = _param_name("p", param_counter[0])
-        param_counter[0] += 1
-
-        # Replace placeholder with parameter name
-        clause = expr.format(param=f"${param_name}")
-        params[param_name] = value
-        return clause
-
-    def handle_field_op(field: str, op: str, value: JsonValue) -> str:
-        """Handle field with operator."""
-        if op == "overlap":
-            # Special handling for list overlap
-            param_name = _param_name("p", param_counter[0])
-            param_counter[0] += 1
-            params[param_name] = value
-            return f"ANY(x IN ${param_name} WHERE x IN {alias}.{field})"
-        if op in _OPS:
-            return add_clause(f"{alias}.{field} {_OPS[op]} {{param}}", value)
-        raise ValueError(f"Unknown filter operator: {op!r}")
-
-    def process_filters(filter_dict: dict[str, JsonValue]) -> list[str]:
-        """Recursively process filter dictionary."""
+    values: list[JsonValue] = []
+    conditions = _compile_shape(_filter_shape(filters, values), alias)
+    return conditions, {_param_name("p", idx): value for idx, value in enumerate(values)}
+
+
+def _filter_shape(filter_dict: dict[str, JsonValue], values: list[JsonValue]) -> _FilterShape:
+    """Strip values out of a filter dict, collecting them in parameter order.
+
+    The returned shape is hashable, so filters that differ only in their
+    values compile to the same cached conditions string.
+    """
+    shape: list[tuple[str, tuple[_FilterShape, ...] | None]] = []
+
+    for key, value in filter_dict.items():
+        if key in ("$or", "$and"):
+            if not isinstance(value, list) or not value:
+                raise ValueError(f"{key} must be a non-empty list of non-empty filter dictionaries")
+            branches = []
+            for item in value:
+                if not isinstance(item, dict) or not item:
+                    raise ValueError(f"{key} must contain only non-empty filter dictionaries")
+                branches.append(_filter_shape(cast("dict[str, JsonValue]", item), values))
+            shape.append((key, tuple(branches)))
+
+        elif value is None and "__" not in key:
+            # NULL check, no parameter
+            shape.append((key, None))
+
+        else:
+            values.append(value)
+            shape.append((key, ()))
+
+    return tuple(shape)
+
+
+@lru_cache(maxsize=256)
+def _compile_shape(shape: _FilterShape, alias: str) -> str:
+    """Render a filter shape into conditions; parameters are numbered in shape order."""
+    param_counter = count()
+
+    def process_filters(entries: _FilterShape) -> list[str]:
+        """Recursively render one level of the shape."""
         local_clauses: list[str] = []
 
-        for key, value in filter_dict.items():
+        for key, branches in entries:
             if key == "$or":
                 # OR group
-                if not isinstance(value, list) or not value:
-                    raise ValueError("$or must be a non-empty list of non-empty filter dictionaries")
                 or_clauses = []
-                for item in value:
-                    if not isinstance(item, dict) or not item:
-                        raise ValueError("$or must contain only non-empty filter dictionaries")
-                    sub_clauses = process_filters(cast("dict[str, JsonValue]", item))
-                    branch = " AND ".join(sub_clauses)
-                    or_clauses.append(f"({branch})" if len(sub_clauses) > 1 else branch)
+                for branch in branches or ():
+                    sub_clauses = process_filters(branch)
+                    joined = " AND ".join(sub_clauses)
+                    or_clauses.append(f"({joined})" if len(sub_clauses) > 1 else joined)
                 local_clauses.append(f"({' OR '.join(or_clauses)})")
 
             elif key == "$and":
                 # AND group
-                if not isinstance(value, list) or not value:
-                    raise ValueError("$and must be a non-empty list of non-empty filter dictionaries")
                 and_clauses = []
-                for item in value:
-                    if not isinstance(item, dict) or not item:
-                        raise ValueError("$and must contain only non-empty filter dictionaries")
-                    and_clauses.extend(process_filters(cast("dict[str, JsonValue]", item)))
+                for branch in branches or ():
+                    and_clauses.extend(process_filters(branch))
                 local_clauses.append(f"({' AND '.join(and_clauses)})")
 
-            elif "__" in key:
-                # Field with operator
-                field, op = key.split("__", 1)
+            else:
+                # Field with operator; a bare field is equality
+                field, has_op, op = key.partition("__")
                 field = validate_identifier(field, kind="field", allowed=_FILTERABLE_FIELDS)
-                local_clauses.append(handle_field_op(field, op, value))
+                if branches is None:
+                    local_clauses.append(f"{alias}.{field} IS NULL")
+                    continue
 
-            elif value is None:
-                # NULL check
-                field = validate_identifier(key, kind="field", allowed=_FILTERABLE_FIELDS)
-                local_clauses.append(f"{alias}.{field} IS NULL")
-
-            else:
-                # Simple equality
-                field = validate_identifier(key, kind="field", allowed=_FILTERABLE_FIELDS)
-                local_clauses.append(add_clause(f"{alias}.{field} = {{param}}", value))
+                template = _OP_TEMPLATES.get(op if has_op else "eq")
+                if template is None:
+                    raise ValueError(f"Unknown filter operator: {op!r}")
+                param = f"${_param_name('p', next(param_counter))}"
+                local_clauses.append(template.format(alias=alias, field=field, param=param))
 
         return local_clauses
 
-    clauses = process_filters(filters)
-    where_clause = "WHERE " + " AND ".join(clauses) if clauses else ""
-
-    return where_clause, params
+    return " AND ".join(process_filters(shape))
 
 
 def merge_params(*param_dicts: dict[str, JsonValue]) -> dict[str, JsonValue]:
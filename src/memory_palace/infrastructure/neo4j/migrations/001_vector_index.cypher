@@ -3,5 +3,6 @@ FOR (m:Memory)
 ON m.embedding
 OPTIONS {indexConfig: {
   `vector.dimensions`: 1024,
-  `vector.similarity_function`: 'cosine'
+  `vector.similarity_function`: 'cosine',
+  `vector.quantization.enabled`: true
 }}
@@ -6,9 +6,12 @@ exactly what you read here. Dynamic parts (labels, relationship types) are
 interpolated from trusted internal enums/models only — never from user input.
 """
 
+from functools import lru_cache
 from typing import Any, LiteralString, cast
 
+from memory_palace.core.constants import VECTOR_SEARCH_K_MULTIPLIER
 from memory_palace.core.logging import get_logger
+from memory_palace.infrastructure.neo4j.filter_compiler import compile_conditions
 from memory_palace.infrastructure.neo4j.identifiers import validate_identifier
 
 logger = get_logger(__name__)
@@ -25,11 +28,45 @@ _RELATIONSHIP_TYPES = frozenset(
     }
 )
 
+# The relationship vocabulary is closed, so render each type's edge queries
+# once at import instead of formatting them on every connect/disconnect.
+_CREATE_RELATIONSHIP_QUERIES: dict[str, str] = {
+    rel_type: f"""
+            MATCH (source:Memory {{id: $source_id}})
+            MATCH (target:Memory {{id: $target_id}})
+            MERGE (source)-[r:`{rel_type}`]->(target)
+            SET r += $properties
+            RETURN r
+            """
+    for rel_type in _RELATIONSHIP_TYPES
+}
+_DELETE_RELATIONSHIP_QUERIES: dict[str, str] = {
+    rel_type: f"""
+                MATCH (source:Memory {{id: $source_id}})-[r:`{rel_type}`]->(target:Memory {{id: $target_id}})
+                DELETE r
+                RETURN count(r) AS deleted
+                """
+    for rel_type in _RELATIONSHIP_TYPES
+}
+
 
 def _validated_labels(labels: list[str]) -> str:
+    return _join_validated_labels(tuple(labels))
+
+
+@lru_cache(maxsize=64)
+def _join_validated_labels(labels: tuple[str, ...]) -> str:
+    # Only a handful of label sets exist (one per memory type), so validate
+    # each once rather than on every query build.
     return ":".join(validate_identifier(label, kind="label") for label in labels)
 
 
+def _recall_projection(alias: str, include_embedding: bool) -> str:
+    # Recall paths project the node without its embedding by default: most
+    # callers never read it back, and it is most of each row's Bolt payload.
+    return alias if include_embedding else f"{alias} {{.*, embedding: null}}"
+
+
 class MemoryQueries:
     """All memory-related queries in one place."""
 
@@ -37,6 +74,7 @@ class MemoryQueries:
     def similarity_search(
         labels: str | None = None,
         additional_filters: str | None = None,
+        include_embedding: bool = False,
     ) -> tuple[LiteralString, dict[str, Any]]:
         """Vector-index similarity search.
 
@@ -44,6 +82,7 @@ class MemoryQueries:
             labels: Optional node label filter (e.g., "FriendUtterance")
             additional_filters: Optional pre-compiled WHERE conditions
                 (from filter_compiler, parameterized — never raw user input)
+            include_embedding: Return each node's vector instead of nulling it
 
         Returns:
             Tuple of (query, params)
@@ -59,7 +98,7 @@ class MemoryQueries:
             CALL db.index.vector.queryNodes('memory_embeddings', $k, $embedding)
             YIELD node, score
             WHERE {" AND ".join(where_conditions)}
-            RETURN node AS m, score AS similarity
+            RETURN {_recall_projection("node", include_embedding)} AS m, score AS similarity
             ORDER BY similarity DESC
             SKIP $offset LIMIT $limit
             """
@@ -78,7 +117,27 @@ class MemoryQueries:
         query = f"""
             MERGE (m:{labels_str} {{id: $id}})
             SET m += $properties
-            RETURN m
+            RETURN m.id AS id
+            """
+
+        return cast(LiteralString, query), {}
+
+    @staticmethod
+    def store_memory_merge_batch(labels: list[str]) -> tuple[LiteralString, dict[str, Any]]:
+        """MERGE many same-labelled memories in one round trip.
+
+        Params: $rows (maps with ``id`` and ``properties``)
+
+        Args:
+            labels: Node labels (from GraphModel.labels(), trusted)
+        """
+        labels_str = _validated_labels(labels)
+
+        query = f"""
+            UNWIND $rows AS row
+            MERGE (m:{labels_str} {{id: row.id}})
+            SET m += row.properties
+            RETURN count(m) AS stored
             """
 
         return cast(LiteralString, query), {}
@@ -90,7 +149,7 @@ class MemoryQueries:
         Params: $memories (ordered maps with ``position`` and ``properties``),
         $create_temporal_links.
         """
-        query = """
+        query: LiteralString = """
             UNWIND $memories AS item
             MERGE (m:Memory {id: item.id})
             SET m += item.properties
@@ -116,16 +175,16 @@ class MemoryQueries:
             }
             RETURN [node IN nodes | node.id] AS stored_ids
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
-    def get_memory_by_id(labels: list[str]) -> tuple[LiteralString, dict[str, Any]]:
-        """Get a specific memory by ID."""
+    def get_memory_by_id(labels: list[str], include_embedding: bool = False) -> tuple[LiteralString, dict[str, Any]]:
+        """Get a specific memory by ID, without its embedding unless asked."""
         labels_str = _validated_labels(labels)
 
         query = f"""
             MATCH (m:{labels_str} {{id: $id}})
-            RETURN m
+            RETURN {_recall_projection("m", include_embedding)} AS m
             """
 
         return cast(LiteralString, query), {}
@@ -138,15 +197,7 @@ class MemoryQueries:
             kind="relationship type",
             allowed=_RELATIONSHIP_TYPES,
         )
-        query = f"""
-            MATCH (source:Memory {{id: $source_id}})
-            MATCH (target:Memory {{id: $target_id}})
-            MERGE (source)-[r:`{relationship_type}`]->(target)
-            SET r += $properties
-            RETURN r
-            """
-
-        return cast(LiteralString, query), {}
+        return cast(LiteralString, _CREATE_RELATIONSHIP_QUERIES[relationship_type]), {}
 
     @staticmethod
     def delete_relationship(relationship_type: str | None = None) -> tuple[LiteralString, dict[str, Any]]:
@@ -157,11 +208,7 @@ class MemoryQueries:
                 kind="relationship type",
                 allowed=_RELATIONSHIP_TYPES,
             )
-            query = f"""
-                MATCH (source:Memory {{id: $source_id}})-[r:`{relationship_type}`]->(target:Memory {{id: $target_id}})
-                DELETE r
-                RETURN count(r) AS deleted
-                """
+            query = _DELETE_RELATIONSHIP_QUERIES[relationship_type]
         else:
             query = """
                 MATCH (source:Memory {id: $source_id})-[r]->(target:Memory {id: $target_id})
@@ -174,7 +221,7 @@ class MemoryQueries:
     @staticmethod
     def detect_relationships() -> tuple[LiteralString, dict[str, Any]]:
         """Find similar memories for relationship detection."""
-        query = """
+        query: LiteralString = """
             CALL db.index.vector.queryNodes('memory_embeddings', 5, $embedding)
             YIELD node, score
             WHERE node.id <> $id AND score > $threshold AND NOT node:Archived
@@ -182,7 +229,7 @@ class MemoryQueries:
             ORDER BY similarity DESC
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def spread_activation(depth: int) -> tuple[LiteralString, dict[str, Any]]:
@@ -211,7 +258,7 @@ class MemoryQueries:
                  max(reduce(a = seed.score,
                             r IN relationships(path) |
                             a * coalesce(r.strength, 0.5) * $hop_decay)) AS activation
-            RETURN m, activation
+            RETURN m {{.*, embedding: null}} AS m, activation
             ORDER BY activation DESC
             LIMIT $limit
             """
@@ -227,7 +274,7 @@ class MemoryQueries:
 
         Params: $ids (list of memory id strings), $now (epoch float), $rate
         """
-        query = """
+        query: LiteralString = """
             UNWIND $ids AS mid
             MATCH (m:Memory {id: mid})
             SET m.access_count = coalesce(m.access_count, 0) + 1,
@@ -237,12 +284,12 @@ class MemoryQueries:
             RETURN count(m) AS reinforced
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def get_relationship_edges() -> tuple[LiteralString, dict[str, Any]]:
         """Get all relationship edges for a specific memory."""
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory {id: $memory_id})-[r]-(other:Memory)
             RETURN type(r) AS relationship_type,
                    r.strength AS strength,
@@ -251,7 +298,7 @@ class MemoryQueries:
                    CASE WHEN startNode(r) = m THEN 'outgoing' ELSE 'incoming' END AS direction
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def top_salient() -> tuple[LiteralString, dict[str, Any]]:
@@ -259,15 +306,15 @@ class MemoryQueries:
 
         Params: $limit
         """
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE NOT m:Archived AND m.salience IS NOT NULL
-            RETURN m
+            RETURN m {.*, embedding: null} AS m
             ORDER BY m.salience DESC, m.timestamp DESC
             LIMIT $limit
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def memory_exists() -> tuple[LiteralString, dict[str, Any]]:
@@ -275,12 +322,11 @@ class MemoryQueries:
 
         Params: $id
         """
-        query = """
-            MATCH (m:Memory {id: $id})
-            RETURN count(m) AS found
+        query: LiteralString = """
+            RETURN EXISTS { MATCH (:Memory {id: $id}) } AS found
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def archive_memory_with_note() -> tuple[LiteralString, dict[str, Any]]:
@@ -288,19 +334,19 @@ class MemoryQueries:
 
         Params: $id, $note_id, $note_properties
         """
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory {id: $id})
             SET m:Archived
             MERGE (note:Memory:SystemNote {id: $note_id})
             ON CREATE SET note += $note_properties
             RETURN count(m) AS archived
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def palace_stats() -> tuple[LiteralString, dict[str, Any]]:
         """Global statistics for the palace: counts by type, time span, health."""
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WITH count(m) AS total,
                  sum(CASE WHEN m:Archived THEN 1 ELSE 0 END) AS archived,
@@ -313,19 +359,19 @@ class MemoryQueries:
                    count(DISTINCT r) AS relationships
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def type_counts() -> tuple[LiteralString, dict[str, Any]]:
         """Unarchived memory counts grouped by memory_type."""
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE NOT m:Archived
             RETURN m.memory_type AS memory_type, count(*) AS count
             ORDER BY count DESC
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
 
 class DreamJobQueries:
@@ -344,7 +390,7 @@ class DreamJobQueries:
 
         Params: $now (epoch float), $decay_lambda (per-day), $floor
         """
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE m.salience IS NOT NULL
               AND coalesce(m.pinned, false) = false
@@ -357,7 +403,7 @@ class DreamJobQueries:
             RETURN count(m) AS updated
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def archive_stale_memories() -> tuple[LiteralString, dict[str, Any]]:
@@ -368,7 +414,7 @@ class DreamJobQueries:
 
         Params: $threshold (salience), $cutoff (epoch float, last-access horizon)
         """
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE coalesce(m.pinned, false) = false
               AND NOT m:Archived
@@ -378,12 +424,12 @@ class DreamJobQueries:
             RETURN count(m) AS archived
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def find_unassigned_memories() -> tuple[LiteralString, dict[str, Any]]:
         """Find recent memories without topic assignments."""
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE m.topic_id IS NULL
               AND m.timestamp > $cutoff
@@ -394,14 +440,14 @@ class DreamJobQueries:
             LIMIT 500
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def assign_topic() -> tuple[LiteralString, dict[str, Any]]:
         """Assign topic ID to a memory."""
-        query = """MATCH (m:Memory {id: $id}) SET m.topic_id = $topic_id"""
+        query: LiteralString = """MATCH (m:Memory {id: $id}) SET m.topic_id = $topic_id"""
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def assign_topics_batch() -> tuple[LiteralString, dict[str, Any]]:
@@ -409,7 +455,7 @@ class DreamJobQueries:
 
         Params: $updates (maps with id and topic_id)
         """
-        query = """
+        query: LiteralString = """
             UNWIND $updates AS update
             MATCH (m:Memory {id: update.id})
             WITH collect({node: m, topic_id: update.topic_id}) AS matched
@@ -419,7 +465,7 @@ class DreamJobQueries:
             SET m.topic_id = CASE WHEN topic_id = -1 THEN null ELSE topic_id END
             RETURN count(m) AS updated
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def get_all_memories_for_clustering() -> tuple[LiteralString, dict[str, Any]]:
@@ -427,7 +473,7 @@ class DreamJobQueries:
 
         Params: $limit
         """
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE m.embedding IS NOT NULL AND NOT m:Archived
             RETURN m.id AS id, m.embedding AS embedding, m.topic_id AS current_topic
@@ -435,7 +481,7 @@ class DreamJobQueries:
             LIMIT $limit
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
 
 class ConsolidationQueries:
@@ -447,7 +493,7 @@ class ConsolidationQueries:
 
         Params: $min_cohort, $max_cohorts, $max_cohort_size
         """
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE (m:FriendUtterance OR m:ClaudeUtterance)
               AND NOT m:Archived
@@ -466,7 +512,7 @@ class ConsolidationQueries:
             LIMIT $max_cohorts
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def find_daily_cohorts() -> tuple[LiteralString, dict[str, Any]]:
@@ -474,7 +520,7 @@ class ConsolidationQueries:
 
         Params: $min_cohort, $max_cohorts, $max_cohort_size
         """
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE (m:FriendUtterance OR m:ClaudeUtterance)
               AND NOT m:Archived
@@ -493,7 +539,7 @@ class ConsolidationQueries:
             LIMIT $max_cohorts
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def finalize_consolidation() -> tuple[LiteralString, dict[str, Any]]:
@@ -501,7 +547,7 @@ class ConsolidationQueries:
 
         Params: $id, $properties, $source_ids
         """
-        query = """
+        query: LiteralString = """
             UNWIND $source_ids AS source_id
             MATCH (source:Memory {id: source_id})
             WITH collect(source) AS sources
@@ -515,7 +561,7 @@ class ConsolidationQueries:
             RETURN c
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
 
 class SchemaQueries:
@@ -523,7 +569,7 @@ class SchemaQueries:
 
     @staticmethod
     def create_constraints() -> list[tuple[LiteralString, dict[str, Any]]]:
-        statements = [
+        statements: list[LiteralString] = [
             "CREATE CONSTRAINT memory_id_unique IF NOT EXISTS FOR (m:Memory) REQUIRE m.id IS UNIQUE",
             "CREATE CONSTRAINT oauth_client_id_unique IF NOT EXISTS FOR (c:OAuthClient) REQUIRE c.client_id IS UNIQUE",
             "CREATE CONSTRAINT oauth_code_unique IF NOT EXISTS FOR (c:OAuthCode) REQUIRE c.code IS UNIQUE",
@@ -532,7 +578,7 @@ class SchemaQueries:
             "CREATE CONSTRAINT embedding_schema_name_unique IF NOT EXISTS FOR (s:EmbeddingSchema) REQUIRE s.name IS UNIQUE",
             "CREATE CONSTRAINT consolidation_cohort_unique IF NOT EXISTS FOR (c:Consolidation) REQUIRE c.cohort_fingerprint IS UNIQUE",
         ]
-        return [(cast(LiteralString, statement), {}) for statement in statements]
+        return [(statement, {}) for statement in statements]
 
 
 class OAuthQueries:
@@ -545,23 +591,23 @@ class OAuthQueries:
     @staticmethod
     def get_client() -> tuple[LiteralString, dict[str, Any]]:
         """Params: $client_id"""
-        query = """
+        query: LiteralString = """
             MATCH (c:OAuthClient {client_id: $client_id})
             RETURN c.client_id AS client_id, c.data_json AS data_json
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def save_client() -> tuple[LiteralString, dict[str, Any]]:
         """Params: $client_id, $data_json, $now"""
-        query = """
+        query: LiteralString = """
             MERGE (c:OAuthClient {client_id: $client_id})
             ON CREATE SET c.created_at = $now
             SET c.data_json = $data_json, c.updated_at = $now
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def save_auth_code() -> tuple[LiteralString, dict[str, Any]]:
@@ -569,7 +615,7 @@ class OAuthQueries:
 
         Params: $code, $data_json, $expires_at, $now
         """
-        query = """
+        query: LiteralString = """
             OPTIONAL MATCH (stale:OAuthCode)
             WHERE stale.expires_at < $now
             DETACH DELETE stale
@@ -586,7 +632,7 @@ class OAuthQueries:
             })
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def get_auth_code() -> tuple[LiteralString, dict[str, Any]]:
@@ -594,13 +640,13 @@ class OAuthQueries:
 
         Params: $code, $now
         """
-        query = """
+        query: LiteralString = """
             MATCH (c:OAuthCode {code: $code})
             WHERE c.expires_at >= $now
             RETURN c.data_json AS data_json
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def consume_auth_code() -> tuple[LiteralString, dict[str, Any]]:
@@ -610,14 +656,14 @@ class OAuthQueries:
 
         Params: $code, $now
         """
-        query = """
+        query: LiteralString = """
             MATCH (c:OAuthCode {code: $code})
             WITH c, c.data_json AS data_json, c.expires_at >= $now AS valid
             DETACH DELETE c
             RETURN data_json, valid
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def save_refresh_token() -> tuple[LiteralString, dict[str, Any]]:
@@ -625,7 +671,7 @@ class OAuthQueries:
 
         Params: $token, $client_id, $family_id, $data_json, $expires_at, $now
         """
-        query = """
+        query: LiteralString = """
             OPTIONAL MATCH (stale:OAuthRefreshToken)
             WHERE stale.expires_at < $now
             DETACH DELETE stale
@@ -639,7 +685,7 @@ class OAuthQueries:
                 created_at: $now
             })
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def rotate_refresh_token() -> tuple[LiteralString, dict[str, Any]]:
@@ -648,7 +694,7 @@ class OAuthQueries:
         Params: $presented_token, $replacement_token, $client_id, $family_id,
         $data_json, $expires_at, $now
         """
-        query = """
+        query: LiteralString = """
             OPTIONAL MATCH (old:OAuthRefreshToken {
                 token: $presented_token,
                 client_id: $client_id,
@@ -671,7 +717,7 @@ class OAuthQueries:
             )
             RETURN valid AS rotated
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
 
 class CacheQueries:
@@ -683,14 +729,15 @@ class CacheQueries:
 
         Params: $key, $model
         """
-        query = """
+        query: LiteralString = """
             MATCH (e:EmbeddingCache {cache_key: $key, model: $model})
             WHERE e.created > datetime() - duration('P30D')
             SET e.hit_count = coalesce(e.hit_count, 0) + 1
-            RETURN e.vector AS embedding
+            RETURN e.vector AS embedding,
+                   (e.created + duration('P30D')).epochSeconds AS expires_at
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def store_embedding() -> tuple[LiteralString, dict[str, Any]]:
@@ -698,27 +745,41 @@ class CacheQueries:
 
         Params: $key, $model, $embedding, $dimensions, $text
         """
-        query = """
+        query: LiteralString = """
             MERGE (e:EmbeddingCache {cache_key: $key, model: $model})
             ON CREATE SET e.hit_count = 0
             SET e.vector = $embedding,
                 e.dimensions = $dimensions,
                 e.created = datetime(),
                 e.text_preview = left($text, 100)
+            RETURN (e.created + duration('P30D')).epochSeconds AS expires_at
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
+
+    @staticmethod
+    def record_embedding_hit() -> tuple[LiteralString, dict[str, Any]]:
+        """Count a hit served from the in-process copy of a cached embedding.
+
+        Params: $key, $model
+        """
+        query: LiteralString = """
+            MATCH (e:EmbeddingCache {cache_key: $key, model: $model})
+            SET e.hit_count = coalesce(e.hit_count, 0) + 1
+            """
+
+        return query, {}
 
     @staticmethod
     def get_cache_stats() -> tuple[LiteralString, dict[str, Any]]:
         """Get statistics about the embedding cache."""
-        query = """
+        query: LiteralString = """
             MATCH (e:EmbeddingCache)
             RETURN count(e) AS size,
                    sum(coalesce(e.hit_count, 0)) AS total_hits
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
 
 class EmbeddingSchemaQueries:
@@ -726,15 +787,15 @@ class EmbeddingSchemaQueries:
 
     @staticmethod
     def get_descriptor() -> tuple[LiteralString, dict[str, Any]]:
-        query = """
+        query: LiteralString = """
             MATCH (s:EmbeddingSchema {name: 'memory_embeddings'})
             RETURN s.model AS model, s.dimensions AS dimensions
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def inspect_corpus() -> tuple[LiteralString, dict[str, Any]]:
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE m.embedding IS NOT NULL
             RETURN count(m) AS embedded,
@@ -745,29 +806,29 @@ class EmbeddingSchemaQueries:
                    sum(CASE WHEN m.embedding_model IS NULL OR m.embedding_dimensions IS NULL THEN 1 ELSE 0 END)
                        AS missing_provenance
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def ensure_descriptor() -> tuple[LiteralString, dict[str, Any]]:
-        query = """
+        query: LiteralString = """
             MERGE (s:EmbeddingSchema {name: 'memory_embeddings'})
             ON CREATE SET s.model = $model, s.dimensions = $dimensions, s.created_at = datetime()
             RETURN s.model AS model, s.dimensions AS dimensions
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def replace_descriptor() -> tuple[LiteralString, dict[str, Any]]:
-        query = """
+        query: LiteralString = """
             MERGE (s:EmbeddingSchema {name: 'memory_embeddings'})
             SET s.model = $model, s.dimensions = $dimensions, s.updated_at = datetime()
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def adopt_legacy_provenance() -> tuple[LiteralString, dict[str, Any]]:
         """Atomically adopt a proven uniform legacy corpus into one vector space."""
-        query = """
+        query: LiteralString = """
             MATCH (m:Memory)
             WHERE m.embedding IS NOT NULL
             WITH collect(m) AS memories,
@@ -791,7 +852,7 @@ class EmbeddingSchemaQueries:
                 schema.updated_at = datetime()
             RETURN size(memories) AS adopted
             """
-        return cast(LiteralString, query), {}
+        return query, {}
 
 
 class VectorIndexQueries:
@@ -800,25 +861,30 @@ class VectorIndexQueries:
     @staticmethod
     def check_vector_index() -> tuple[LiteralString, dict[str, Any]]:
         """Check if vector index exists and get its configuration."""
-        query = """
+        query: LiteralString = """
             SHOW INDEXES
             YIELD name, type, labelsOrTypes, properties, options, state
             WHERE name = 'memory_embeddings'
             RETURN type, labelsOrTypes, properties, options, state
             """
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def drop_vector_index() -> tuple[LiteralString, dict[str, Any]]:
         """Drop the existing vector index."""
-        query = "DROP INDEX memory_embeddings IF EXISTS"
+        query: LiteralString = "DROP INDEX memory_embeddings IF EXISTS"
 
-        return cast(LiteralString, query), {}
+        return query, {}
 
     @staticmethod
     def create_vector_index(dimensions: int) -> tuple[LiteralString, dict[str, Any]]:
-        """Create vector index with specified dimensions."""
+        """Create vector index with specified dimensions.
+
+        Quantization keeps a compact copy of each vector in the HNSW graph
+        for traversal while m.embedding stays full precision; it is pinned
+        explicitly rather than left to the server version's default.
+        """
         if not 1 <= dimensions <= 4_096:
             raise ValueError("vector dimensions must be between 1 and 4096")
         query = f"""
@@ -826,7 +892,8 @@ class VectorIndexQueries:
             FOR (m:Memory) ON m.embedding
             OPTIONS {{indexConfig: {{
               `vector.dimensions`: {dimensions},
-              `vector.similarity_function`: 'cosine'
+              `vector.similarity_function`: 'cosine',
+              `vector.quantization.enabled`: true
             }}}}
             """
 
@@ -844,51 +911,51 @@ class QueryFactory:
         offset: int = 0,
         labels: str | None = None,
         filters: dict[str, Any] | None = None,
+        include_embedding: bool = False,
     ) -> tuple[str, dict[str, Any]]:
         """Build a complete similarity search query with parameters."""
-        from memory_palace.core.constants import VECTOR_SEARCH_K_MULTIPLIER
-
-        filter_clause = None
+        filter_clause = ""
         params: dict[str, Any] = {
             "embedding": embedding,
             "threshold": threshold,
             "limit": limit,
             "offset": offset,
-            "k": max(limit * VECTOR_SEARCH_K_MULTIPLIER, 50),  # Widen k for better recall
+            # The index returns its top k before the WHERE drops archived,
+            # off-label and filtered nodes, so widen k over the whole page
+            # window, offset included, or later pages come back short.
+            "k": max((limit + offset) * VECTOR_SEARCH_K_MULTIPLIER, 50),
         }
 
         if filters:
-            from memory_palace.infrastructure.neo4j.filter_compiler import compile_filters
-
-            where_clause, filter_params = compile_filters(filters, alias="node")
-            if where_clause.startswith("WHERE "):
-                filter_clause = where_clause[6:]
-                params.update(filter_params)
+            filter_clause, filter_params = compile_conditions(filters, alias="node")
+            params.update(filter_params)
 
-        query, _ = MemoryQueries.similarity_search(labels=labels, additional_filters=filter_clause)
+        query, _ = MemoryQueries.similarity_search(
+            labels=labels, additional_filters=filter_clause, include_embedding=include_embedding
+        )
 
         return query, params
 
     @staticmethod
     def build_filtered_recall(
-        labels: list[str], filters: dict[str, Any] | None, limit: int, offset: int = 0
+        labels: list[str],
+        filters: dict[str, Any] | None,
+        limit: int,
+        offset: int = 0,
+        include_embedding: bool = False,
     ) -> tuple[str, dict[str, Any]]:
         """Build a filtered recall query."""
         labels_str = _validated_labels(labels)
 
-        conditions = ["NOT m:Archived"]
-        where_params: dict[str, Any] = {}
-        if filters:
-            from memory_palace.infrastructure.neo4j.filter_compiler import compile_filters
-
-            where_clause, where_params = compile_filters(filters, alias="m")
-            if where_clause.startswith("WHERE "):
-                conditions.append(where_clause[6:])
+        conditions = "NOT m:Archived"
+        filter_conditions, where_params = compile_conditions(filters, alias="m")
+        if filter_conditions:
+            conditions = f"{conditions} AND {filter_conditions}"
 
         query = f"""
             MATCH (m:{labels_str})
-            WHERE {" AND ".join(conditions)}
-            RETURN m
+            WHERE {conditions}
+            RETURN {_recall_projection("m", include_embedding)} AS m
             ORDER BY m.timestamp DESC
             SKIP $offset LIMIT $limit
             """
@@ -1,15 +1,16 @@
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from typing import Any, LiteralString, cast
 from uuid import UUID
 
-from neo4j import AsyncSession
+from neo4j import AsyncManagedTransaction, AsyncSession
+from pydantic import TypeAdapter
 
 from memory_palace.core.base import ErrorLevel
 from memory_palace.core.decorators import with_error_handling
+from memory_palace.core.errors import ProcessingError
 from memory_palace.core.logging import get_logger
 from memory_palace.domain.models.base import GraphModel
 from memory_palace.domain.models.memories import Memory
-from memory_palace.infrastructure.neo4j.filter_compiler import compile_filters
 from memory_palace.infrastructure.neo4j.queries import (
     MemoryQueries,
     QueryFactory,
@@ -17,6 +18,40 @@ from memory_palace.infrastructure.neo4j.queries import (
 
 logger = get_logger(__name__)
 
+# Building the union validator compiles a pydantic-core schema; do it once.
+# Validating a list runs the per-item loop inside pydantic-core.
+_MEMORY_LIST_ADAPTER: TypeAdapter[list[Memory]] = TypeAdapter(list[Memory])
+
+
+async def _fetch_all(tx: AsyncManagedTransaction, query: LiteralString, params: dict[str, Any]) -> list[dict[str, Any]]:
+    """Transaction function: run one query and drain its records."""
+    result = await tx.run(query, params)
+    return await result.data()
+
+
+async def _merge_label_groups(tx: AsyncManagedTransaction, groups: dict[tuple[str, ...], list[dict[str, Any]]]) -> None:
+    """Transaction function: UNWIND-MERGE every label group, all or nothing.
+
+    A short stored count raises inside the transaction, so the driver rolls
+    back the groups already written.
+    """
+    for labels, rows in groups.items():
+        query, _ = MemoryQueries.store_memory_merge_batch(list(labels))
+        result = await tx.run(query, {"rows": rows})
+        record = await result.single()
+        stored = record["stored"] if record else 0
+        if stored != len(rows):
+            raise ProcessingError(
+                message="Failed to store memory batch in database",
+                details={
+                    "source": "memory_repository",
+                    "operation": "store_memory_batch",
+                    "labels": list(labels),
+                    "expected": len(rows),
+                    "stored": stored,
+                },
+            )
+
 
 class GenericMemoryRepository[T: GraphModel]:
     """Generic repository for all memory types using discriminated unions and type safety."""
@@ -24,24 +59,42 @@ class GenericMemoryRepository[T: GraphModel]:
     def __init__(self, session: AsyncSession) -> None:
         self.session = session
 
+    async def _read(self, query: LiteralString, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Run a read query as a managed transaction.
+
+        The driver retries transient failures and may route the read to a
+        follower in a cluster.
+        """
+        return await self.session.execute_read(_fetch_all, query, params)
+
+    async def _write(self, query: LiteralString, params: dict[str, Any]) -> list[dict[str, Any]]:
+        """Run a write query as a managed transaction, retried on transient failures.
+
+        Every write here is an idempotent MERGE/DELETE, so a retry is safe.
+        """
+        return await self.session.execute_write(_fetch_all, query, params)
+
     @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
     async def remember(self, memory: T) -> T:
-        """Store any type of memory with full type safety."""
+        """Store any type of memory with full type safety.
+
+        A ``None`` embedding is not written, so storing a memory recalled
+        without its vector leaves the stored vector in place.
+        """
         labels = memory.labels()
         properties = memory.to_neo4j_properties()
 
-        logger.debug(f"Storing {memory.__class__.__name__} with labels: {labels}")
+        logger.debug("Storing memory", memory_type=type(memory).__name__, labels=labels)
 
         # Use centralized query for MERGE
         query, _ = MemoryQueries.store_memory_merge(labels)
 
-        result = await self.session.run(query, id=str(memory.id), properties=properties)
-
-        # Verify the memory was stored
-        record = await result.single()
-        if not record:
-            from memory_palace.core.errors import ProcessingError
+        # to_neo4j_properties already stringified the UUID; reuse it as the key
+        records = await self._write(query, {"id": properties["id"], "properties": properties})
 
+        # The write only echoes the id back: the caller already holds the
+        # properties, and the node itself would ship the embedding again
+        if not records:
             raise ProcessingError(
                 message="Failed to store memory in database",
                 details={
@@ -52,9 +105,23 @@ class GenericMemoryRepository[T: GraphModel]:
                 },
             )
 
-        logger.debug(f"Successfully stored memory {memory.id}")
+        logger.debug("Stored memory", memory_id=str(memory.id))
         return memory
 
+    @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
+    async def remember_many(self, memories: Sequence[T]) -> list[T]:
+        """Store a batch of memories in one transaction, one UNWIND query per label set."""
+        batches: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+        for memory in memories:
+            properties = memory.to_neo4j_properties()
+            batches.setdefault(tuple(memory.labels()), []).append({"id": properties["id"], "properties": properties})
+
+        if batches:
+            await self.session.execute_write(_merge_label_groups, batches)
+
+        logger.debug("Stored memory batch", count=len(memories), writes=len(batches))
+        return list(memories)
+
     @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
     async def recall(
         self,
@@ -63,8 +130,13 @@ class GenericMemoryRepository[T: GraphModel]:
         similarity_search: tuple[list[float], float] | None = None,
         limit: int = 100,
         offset: int = 0,
+        include_embedding: bool = False,
     ) -> list[T]:
-        """Recall memories with type safety and optional similarity search."""
+        """Recall memories with type safety and optional similarity search.
+
+        Recalled memories carry ``embedding=None`` unless ``include_embedding``
+        is set. Writing one back through ``remember`` keeps the stored vector.
+        """
         # Get labels from the memory type class
         labels = memory_type.labels()
         labels_str = ":".join(labels)
@@ -73,39 +145,43 @@ class GenericMemoryRepository[T: GraphModel]:
             embedding, threshold = similarity_search
             # Use centralized query factory
             query, params = QueryFactory.build_similarity_search(
-                embedding=embedding, threshold=threshold, limit=limit, offset=offset, labels=labels_str, filters=filters
+                embedding=embedding,
+                threshold=threshold,
+                limit=limit,
+                offset=offset,
+                labels=labels_str,
+                filters=filters,
+                include_embedding=include_embedding,
             )
         else:
             # Use centralized query factory
             query, params = QueryFactory.build_filtered_recall(
-                labels=labels, filters=filters, limit=limit, offset=offset
+                labels=labels, filters=filters, limit=limit, offset=offset, include_embedding=include_embedding
             )
 
-        result = await self.session.run(cast(LiteralString, query), **params)
+        records = await self._read(cast(LiteralString, query), params)
 
-        memories = []
-        async for record in result:
-            # Let _record_to_memory handle errors with proper error handling
-            # It will raise ProcessingError if it fails
-            memory = self._record_to_memory(record["m"], memory_type)
-            memories.append(memory)
+        # _record_to_memory raises ProcessingError on a bad record
+        memories = [self._record_to_memory(record["m"], memory_type) for record in records]
 
-        logger.debug(f"Recalled {len(memories)} memories of type {memory_type.__name__}")
+        logger.debug("Recalled memories", count=len(memories), memory_type=memory_type.__name__)
         return memories
 
     @with_error_handling(error_level=ErrorLevel.WARNING, reraise=False)
-    async def get_by_id(self, memory_id: UUID, memory_type: type[T]) -> T | None:
-        """Get a specific memory by ID with type safety."""
+    async def get_by_id(self, memory_id: UUID, memory_type: type[T], include_embedding: bool = False) -> T | None:
+        """Get a specific memory by ID with type safety.
+
+        The embedding is only loaded when ``include_embedding`` is set.
+        """
         labels = memory_type.labels()
 
         # Use centralized query
-        query, _ = MemoryQueries.get_memory_by_id(labels)
+        query, _ = MemoryQueries.get_memory_by_id(labels, include_embedding)
 
-        result = await self.session.run(query, id=str(memory_id))
-        record = await result.single()
+        records = await self._read(query, {"id": str(memory_id)})
 
-        if record:
-            return self._record_to_memory(record["m"], memory_type)
+        if records:
+            return self._record_to_memory(records[0]["m"], memory_type)
         return None
 
     @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
@@ -116,9 +192,16 @@ class GenericMemoryRepository[T: GraphModel]:
         # Use centralized query with proper relationship type parameter
         query, _ = MemoryQueries.create_relationship(relationship_type)
 
-        await self.session.run(query, source_id=str(source_id), target_id=str(target_id), properties=properties or {})
+        await self._write(
+            query, {"source_id": str(source_id), "target_id": str(target_id), "properties": properties or {}}
+        )
 
-        logger.debug(f"Created {relationship_type} relationship: {source_id} -> {target_id}")
+        logger.debug(
+            "Created relationship",
+            relationship_type=relationship_type,
+            source_id=str(source_id),
+            target_id=str(target_id),
+        )
 
     @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
     async def disconnect(self, source_id: UUID, target_id: UUID, relationship_type: str | None = None) -> None:
@@ -126,35 +209,13 @@ class GenericMemoryRepository[T: GraphModel]:
         # Use centralized query
         query, _ = MemoryQueries.delete_relationship(relationship_type)
 
-        result = await self.session.run(query, source_id=str(source_id), target_id=str(target_id))
+        records = await self._write(query, {"source_id": str(source_id), "target_id": str(target_id)})
 
-        record = await result.single()
-        deleted_count = record["deleted"] if record else 0
-        logger.debug(f"Deleted {deleted_count} relationships between {source_id} and {target_id}")
-
-    def _build_where_clause(self, filters: dict[str, Any] | None) -> tuple[str, dict[str, Any]]:
-        """Build WHERE clause from filters using safe parameterization.
-
-        Returns:
-            Tuple of (WHERE clause, parameters dict)
-        """
-        return compile_filters(filters, alias="m")
-
-    def _build_filter_clause(self, filters: dict[str, Any] | None, alias: str = "m") -> tuple[str, dict[str, Any]]:
-        """Build filter clause for similarity search (assumes WHERE already used).
-
-        Returns:
-            Tuple of (filter clause, parameters dict)
-        """
-        where_clause, params = compile_filters(filters, alias=alias)
-        # Remove "WHERE " prefix since similarity search already has WHERE
-        filter_clause = " AND " + where_clause[6:] if where_clause.startswith("WHERE ") else ""
-        return filter_clause, params
+        deleted_count = records[0]["deleted"] if records else 0
+        logger.debug("Deleted relationships", count=deleted_count, source_id=str(source_id), target_id=str(target_id))
 
     def _record_to_memory(self, record: dict, memory_type: type[T]) -> T:
         """Convert Neo4j record to memory object."""
-        from memory_palace.core.errors import ProcessingError
-
         try:
             return memory_type.from_neo4j_record(record)
         except Exception as e:
@@ -184,21 +245,22 @@ class MemoryRepository(GenericMemoryRepository[Memory]):
     """Specialized repository for the Memory discriminated union."""
 
     @staticmethod
-    def _validate_union_record(node: Mapping[str, object]) -> Memory | None:
-        """Validate a Neo4j node mapping into the Memory union.
+    def _validate_union_records(records: Sequence[Mapping[str, Any]]) -> list[tuple[Memory, Mapping[str, Any]]]:
+        """Validate each record's ``m`` node into the Memory union in one batch.
 
-        Returns None (with a warning) for nodes missing memory_type —
-        legacy debris that predates the discriminated union.
+        Returns (memory, record) pairs so callers can read the record's other
+        columns. Nodes missing memory_type (legacy debris that predates the
+        discriminated union) are skipped with a warning.
         """
-        from pydantic import TypeAdapter
-
-        data = dict(node)
-        if "memory_type" not in data:
-            logger.warning("Memory record missing memory_type field", extra={"record_id": data.get("id")})
-            return None
+        kept: list[Mapping[str, Any]] = []
+        for record in records:
+            if "memory_type" not in record["m"]:
+                logger.warning("Memory record missing memory_type field", record_id=record["m"].get("id"))
+                continue
+            kept.append(record)
 
-        adapter: TypeAdapter[Memory] = TypeAdapter(Memory)
-        return adapter.validate_python(data)
+        memories = _MEMORY_LIST_ADAPTER.validate_python([record["m"] for record in kept])
+        return list(zip(memories, kept, strict=True))
 
     @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
     async def recall_scored(
@@ -212,27 +274,17 @@ class MemoryRepository(GenericMemoryRepository[Memory]):
         query, params = QueryFactory.build_similarity_search(
             embedding=embedding, threshold=threshold, limit=limit, filters=filters
         )
-        result = await self.session.run(cast(LiteralString, query), **params)
+        records = await self._read(cast(LiteralString, query), params)
 
-        scored: list[tuple[Memory, float]] = []
-        async for record in result:
-            memory = self._validate_union_record(record["m"])
-            if memory is not None:
-                scored.append((memory, record["similarity"]))
-        return scored
+        return [(memory, record["similarity"]) for memory, record in self._validate_union_records(records)]
 
     @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
     async def top_salient(self, limit: int = 10) -> list[Memory]:
         """Most important unarchived memories, by salience then recency."""
         query, _ = MemoryQueries.top_salient()
-        result = await self.session.run(query, limit=limit)
+        records = await self._read(query, {"limit": limit})
 
-        memories: list[Memory] = []
-        async for record in result:
-            memory = self._validate_union_record(record["m"])
-            if memory is not None:
-                memories.append(memory)
-        return memories
+        return [memory for memory, _ in self._validate_union_records(records)]
 
     @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
     async def expand_from_seeds(
@@ -252,19 +304,16 @@ class MemoryRepository(GenericMemoryRepository[Memory]):
             return []
 
         query, _ = MemoryQueries.spread_activation(depth)
-        result = await self.session.run(
+        records = await self._read(
             query,
-            seeds=[{"id": str(mid), "score": score} for mid, score in seeds],
-            hop_decay=hop_decay,
-            limit=limit,
+            {
+                "seeds": [{"id": str(mid), "score": score} for mid, score in seeds],
+                "hop_decay": hop_decay,
+                "limit": limit,
+            },
         )
 
-        activated: list[tuple[Memory, float]] = []
-        async for record in result:
-            memory = self._validate_union_record(record["m"])
-            if memory is not None:
-                activated.append((memory, record["activation"]))
-        return activated
+        return [(memory, record["activation"]) for memory, record in self._validate_union_records(records)]
 
     @with_error_handling(error_level=ErrorLevel.ERROR, reraise=True)
     async def recall_any(
@@ -273,8 +322,12 @@ class MemoryRepository(GenericMemoryRepository[Memory]):
         similarity_search: tuple[list[float], float] | None = None,
         limit: int = 100,
         offset: int = 0,
+        include_embedding: bool = False,
     ) -> list[Memory]:
-        """Recall memories of any type using the discriminated union."""
+        """Recall memories of any type using the discriminated union.
+
+        As with ``recall``, embeddings are only loaded with ``include_embedding``.
+        """
         if similarity_search:
             embedding, threshold = similarity_search
             # Use centralized query factory (no specific labels for Memory union)
@@ -285,6 +338,7 @@ class MemoryRepository(GenericMemoryRepository[Memory]):
                 offset=offset,
                 labels=None,  # No specific labels for discriminated union
                 filters=filters,
+                include_embedding=include_embedding,
             )
         else:
             # Use centralized query factory
@@ -293,16 +347,13 @@ class MemoryRepository(GenericMemoryRepository[Memory]):
                 filters=filters,
                 limit=limit,
                 offset=offset,
+                include_embedding=include_embedding,
             )
 
-        result = await self.session.run(cast(LiteralString, query), **params)
+        records = await self._read(cast(LiteralString, query), params)
 
-        memories = []
-        async for record in result:
-            # Use the discriminated union to automatically determine type
-            memory = self._validate_union_record(record["m"])
-            if memory is not None:
-                memories.append(memory)
+        # The discriminated union picks each memory's concrete type
+        memories = [memory for memory, _ in self._validate_union_records(records)]
 
-        logger.debug(f"Recalled {len(memories)} memories of mixed types")
+        logger.debug("Recalled memories", count=len(memories), memory_type="mixed")
         return memories
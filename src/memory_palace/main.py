@@ -156,6 +156,9 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None]:
             await dream_orchestrator.shutdown()
             logger.info("✅ Dream Job Orchestrator stopped")
 
+        if embedding_service:
+            await embedding_service.close()
+
         if neo4j_driver:
             logger.info("📊 Closing Neo4j connection...")
             await neo4j_driver.close()
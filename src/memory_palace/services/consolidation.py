@@ -127,8 +127,9 @@ class ConsolidationService:
                 max_cohorts=max_cohorts - len(cohorts),
                 max_cohort_size=max_cohort_size,
             )
-            async for record in result:
-                cohorts.append((str(record["cohort_key"]), [dict(e) for e in record["episodes"]]))
+            cohorts.extend(
+                (str(record["cohort_key"]), [dict(e) for e in record["episodes"]]) for record in await result.data()
+            )
         return cohorts
 
     @staticmethod
@@ -19,6 +19,17 @@ from uuid import NAMESPACE_URL, UUID, uuid4, uuid5
 from pydantic import BaseModel, ConfigDict
 
 from memory_palace.core.base import ErrorLevel
+from memory_palace.core.constants import (
+    RECALL_WEIGHT_ACTIVATION,
+    RECALL_WEIGHT_SALIENCE,
+    RECALL_WEIGHT_SIMILARITY,
+    SALIENCE_DEFAULT,
+    SALIENCE_REINFORCEMENT_RATE,
+    SIMILARITY_THRESHOLD_HIGH,
+    SPREAD_ACTIVATION_DEPTH,
+    SPREAD_ACTIVATION_HOP_DECAY,
+    SPREAD_ACTIVATION_SEEDS,
+)
 from memory_palace.core.decorators import error_context, with_error_handling
 from memory_palace.core.logging import get_logger
 from memory_palace.domain.models.base import MemoryType
@@ -165,8 +176,6 @@ class MemoryService:
         embeddings = await self.embeddings.embed_batch([content])
         embedding = embeddings[0]
 
-        from memory_palace.core.constants import SALIENCE_DEFAULT
-
         memory_salience = salience if salience is not None else SALIENCE_DEFAULT
 
         # Auto-classify into topics if clusterer is available
@@ -226,8 +235,6 @@ class MemoryService:
             if len(topic_ids) != len(writes):
                 raise ValueError("Clustering provider returned the wrong batch cardinality")
 
-        from memory_palace.core.constants import SALIENCE_DEFAULT
-
         memories: list[FriendUtterance | ClaudeUtterance] = []
         for write, embedding, topic_id in zip(writes, embeddings, topic_ids, strict=True):
             memory_cls = FriendUtterance if write.role == "user" else ClaudeUtterance
@@ -340,8 +347,6 @@ class MemoryService:
         self, memory: FriendUtterance | ClaudeUtterance, similarity_threshold: float | None = None
     ) -> list[MemoryRelationship]:
         """Find and create semantic relationships using the query builder and specifications."""
-        from memory_palace.core.constants import SIMILARITY_THRESHOLD_HIGH
-
         if similarity_threshold is None:
             similarity_threshold = SIMILARITY_THRESHOLD_HIGH
 
@@ -356,9 +361,9 @@ class MemoryService:
             threshold=similarity_threshold,
         )
 
-        # Process similar memories
-        async for record in result:
-            other_data = dict(record["other"])
+        # Drain the candidates before writing edges back through the same session
+        for record in await result.data():
+            other_data = record["other"]
             similarity = record["similarity"]
             other_id = UUID(other_data["id"])
 
@@ -420,15 +425,6 @@ class MemoryService:
         3. Ranking: score = w_sim*similarity + w_act*activation + w_sal*salience.
         4. Reconsolidation: everything returned gets reinforced.
         """
-        from memory_palace.core.constants import (
-            RECALL_WEIGHT_ACTIVATION,
-            RECALL_WEIGHT_SALIENCE,
-            RECALL_WEIGHT_SIMILARITY,
-            SPREAD_ACTIVATION_DEPTH,
-            SPREAD_ACTIVATION_HOP_DECAY,
-            SPREAD_ACTIVATION_SEEDS,
-        )
-
         query_embedding = await self.embeddings.embed_text(query)
 
         # Stage 1: direct semantic matches, scores preserved
@@ -494,8 +490,6 @@ class MemoryService:
         if not memory_ids:
             return
 
-        from memory_palace.core.constants import SALIENCE_REINFORCEMENT_RATE
-
         query, _ = MemoryQueries.reinforce_memories()
         await self.run_query(
             query,
@@ -590,7 +584,7 @@ class MemoryService:
 
         counts_query, _ = MemoryQueries.type_counts()
         result = await self.run_query(counts_query)
-        type_counts = {record["memory_type"]: record["count"] async for record in result}
+        type_counts = {record["memory_type"]: record["count"] for record in await result.data()}
 
         stats_values: dict[str, object] = {"memory_types": type_counts}
         if stats_record:
@@ -677,19 +671,8 @@ class MemoryService:
         query, _ = MemoryQueries.get_relationship_edges()
 
         result = await self.run_query(query, memory_id=str(memory_id))
-        relationships = []
-        async for record in result:
-            relationships.append(
-                {
-                    "relationship_type": record["relationship_type"],
-                    "strength": record["strength"],
-                    "auto_detected": record["auto_detected"],
-                    "other_id": record["other_id"],
-                    "direction": record["direction"],
-                }
-            )
-
-        return relationships
+        # The query projects exactly the edge fields callers expect
+        return await result.data()
 
     async def get_topic_memories(self, topic_id: int, limit: int = 50) -> list[Memory]:
         """Get all memories belonging to a specific topic cluster."""
@@ -174,3 +174,10 @@ def test_production_rejects_non_ip_or_non_loopback_http_callback(redirect_uri: s
 
     with pytest.raises(ValueError, match="OAUTH_ALLOWED_REDIRECT_URIS"):
         config.validate_runtime()
+
+
+def test_log_level_is_validated() -> None:
+    assert Settings(_env_file=None, log_level="DEBUG").log_level == "DEBUG"
+
+    with pytest.raises(ValueError, match="log_level"):
+        Settings(_env_file=None, log_level="VERBOSE")
@@ -16,6 +16,9 @@ class StubEmbeddingService:
     def get_model_dimensions(self) -> int:
         return 2
 
+    async def close(self) -> None:
+        pass
+
 
 def test_embedding_attachment_overwrites_stale_vector_and_provenance() -> None:
     consolidation = Consolidation(
@@ -1,6 +1,7 @@
-"""Tests for model-scoped embedding cache identity."""
+"""Tests for model-scoped embedding cache identity and its in-process copy."""
 
 import hashlib
+import time
 from dataclasses import dataclass, field
 from types import TracebackType
 from typing import cast
@@ -24,11 +25,11 @@ class _RecordingSession:
         return _EmptyResult()
 
 
-class _SessionContext:
-    def __init__(self, session: _RecordingSession) -> None:
+class _SessionContext[S]:
+    def __init__(self, session: S) -> None:
         self._session = session
 
-    async def __aenter__(self) -> _RecordingSession:
+    async def __aenter__(self) -> S:
         return self._session
 
     async def __aexit__(
@@ -44,7 +45,7 @@ class _RecordingDriver:
     def __init__(self) -> None:
         self.session_instance = _RecordingSession()
 
-    def session(self) -> _SessionContext:
+    def session(self) -> _SessionContext[_RecordingSession]:
         return _SessionContext(self.session_instance)
 
 
@@ -57,3 +58,62 @@ async def test_cache_uses_model_scoped_sha256_key() -> None:
     expected = hashlib.sha256(b"voyage-4-large::remember this").hexdigest()
     assert driver.session_instance.parameters == [{"key": expected, "model": "voyage-4-large"}]
     assert len(expected) == 64
+
+
+class _Result:
+    def __init__(self, record: dict[str, object] | None) -> None:
+        self._record = record
+
+    async def single(self) -> dict[str, object] | None:
+        return self._record
+
+    async def consume(self) -> None:
+        return None
+
+
+@dataclass
+class _ScriptedSession:
+    """Answers each run with the next scripted record, recording the query."""
+
+    records: list[dict[str, object] | None]
+    queries: list[str] = field(default_factory=list)
+
+    async def run(self, query: str, **_parameters: object) -> _Result:
+        self.queries.append(query)
+        return _Result(self.records.pop(0) if self.records else None)
+
+
+class _ScriptedDriver:
+    def __init__(self, *records: dict[str, object] | None) -> None:
+        self.session_instance = _ScriptedSession(list(records))
+
+    def session(self) -> _SessionContext[_ScriptedSession]:
+        return _SessionContext(self.session_instance)
+
+
+async def test_memo_hit_returns_a_copy_and_aclose_drains_the_hit_counts() -> None:
+    driver = _ScriptedDriver({"expires_at": time.time() + 3600})
+    cache = EmbeddingCache(cast(AsyncDriver, driver))
+
+    await cache.store("remember this", "voyage-4-large", [0.1, 0.2], 2)
+    served = await cache.get_cached("remember this", "voyage-4-large")
+    assert served == [0.1, 0.2]
+    served.append(9.9)
+    assert await cache.get_cached("remember this", "voyage-4-large") == [0.1, 0.2]
+
+    await cache.aclose()
+    assert not cache._hit_tasks
+    queries = driver.session_instance.queries
+    assert len(queries) == 3  # the store, then one hit bump per memo hit
+    assert all("SET e.hit_count = coalesce(e.hit_count, 0) + 1" in query for query in queries[1:])
+
+
+async def test_expired_memo_entry_falls_back_to_neo4j() -> None:
+    driver = _ScriptedDriver({"expires_at": time.time() - 1}, None)
+    cache = EmbeddingCache(cast(AsyncDriver, driver))
+
+    await cache.store("remember this", "voyage-4-large", [0.1, 0.2], 2)
+
+    # Neo4j no longer returns the expired node, so neither does the memo
+    assert await cache.get_cached("remember this", "voyage-4-large") is None
+    assert "WHERE e.created > datetime() - duration('P30D')" in driver.session_instance.queries[1]
@@ -14,6 +14,7 @@ def _index_record(**overrides: object) -> dict[str, object]:
             "indexConfig": {
                 "vector.dimensions": 1_024,
                 "vector.similarity_function": "cosine",
+                "vector.quantization.enabled": True,
             }
         },
     }
@@ -21,7 +22,7 @@ def _index_record(**overrides: object) -> dict[str, object]:
     return record
 
 
-def test_vector_index_contract_checks_label_property_metric_and_dimensions() -> None:
+def test_vector_index_contract_checks_label_property_metric_dimensions_and_quantization() -> None:
     assert _vector_index_matches(_index_record(), 1_024) is True
     assert (
         _vector_index_matches(
@@ -30,6 +31,7 @@ def test_vector_index_contract_checks_label_property_metric_and_dimensions() ->
                     "indexConfig": {
                         "vector.dimensions": 1_024,
                         "vector.similarity_function": "COSINE",
+                        "vector.quantization.enabled": True,
                     }
                 }
             ),
@@ -41,6 +43,8 @@ def test_vector_index_contract_checks_label_property_metric_and_dimensions() ->
     assert _vector_index_matches(_index_record(properties=["other"]), 1_024) is False
     assert _vector_index_matches(_index_record(), 2_048) is False
     assert _vector_index_matches(_index_record(options={"indexConfig": {}}), 1_024) is False
+    unquantized = {"vector.dimensions": 1_024, "vector.similarity_function": "cosine"}
+    assert _vector_index_matches(_index_record(options={"indexConfig": unquantized}), 1_024) is False
 
 
 def test_bootstrap_queries_inspect_corpus_and_full_index_contract() -> None:
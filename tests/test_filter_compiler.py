@@ -2,7 +2,7 @@
 
 import pytest
 
-from memory_palace.infrastructure.neo4j.filter_compiler import compile_filters
+from memory_palace.infrastructure.neo4j.filter_compiler import compile_conditions, compile_filters
 
 
 def test_or_group_preserves_boolean_semantics() -> None:
@@ -67,3 +67,38 @@ def test_and_group_preserves_boolean_semantics() -> None:
 def test_empty_and_group_is_rejected() -> None:
     with pytest.raises(ValueError, match=r"\$and"):
         compile_filters({"$and": []})
+
+
+def test_conditions_omit_where_prefix_for_embedding_in_existing_clauses() -> None:
+    conditions, params = compile_conditions({"pinned": True, "salience__gte": 0.5}, alias="node")
+
+    assert conditions == "node.pinned = $p_0 AND node.salience >= $p_1"
+    assert params == {"p_0": True, "p_1": 0.5}
+    assert compile_conditions(None) == ("", {})
+
+
+@pytest.mark.parametrize(
+    ("key", "expected"),
+    [
+        ("salience__lt", "m.salience < $p_0"),
+        ("conversation_id__ne", "m.conversation_id <> $p_0"),
+        ("topic_id__in", "m.topic_id IN $p_0"),
+        ("memory_type__startswith", "m.memory_type STARTS WITH $p_0"),
+        ("topic_id__overlap", "ANY(x IN $p_0 WHERE x IN m.topic_id)"),
+    ],
+)
+def test_operator_clauses_render_from_templates(key: str, expected: str) -> None:
+    conditions, params = compile_conditions({key: [1]})
+
+    assert conditions == expected
+    assert params == {"p_0": [1]}
+
+
+def test_filters_with_the_same_shape_reuse_conditions_but_not_values() -> None:
+    first = compile_conditions({"salience__gte": 0.5, "topic_id": None, "$or": [{"pinned": True}]})
+    second = compile_conditions({"salience__gte": 0.9, "topic_id": None, "$or": [{"pinned": False}]})
+
+    assert first[0] == "m.salience >= $p_0 AND m.topic_id IS NULL AND (m.pinned = $p_1)"
+    assert second[0] is first[0]
+    assert first[1] == {"p_0": 0.5, "p_1": True}
+    assert second[1] == {"p_0": 0.9, "p_1": False}
@@ -0,0 +1,77 @@
+"""Unit tests for MemoryRepository batch writes against a fake session."""
+
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any, Concatenate, cast
+
+import pytest
+from neo4j import AsyncSession
+
+from memory_palace.core.errors import ProcessingError
+from memory_palace.domain.models.memories import ClaudeUtterance, FriendUtterance, SystemNote
+from memory_palace.infrastructure.repositories.memory import MemoryRepository
+
+
+class _Result:
+    def __init__(self, row: dict[str, Any]) -> None:
+        self._row = row
+
+    async def single(self) -> dict[str, Any]:
+        return self._row
+
+
+@dataclass
+class _FakeSession:
+    """Acts as its own managed transaction; reports a stored count per batch."""
+
+    short_by: int = 0
+    transactions: int = 0
+    calls: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+
+    async def execute_write[**P, R](
+        self, work: Callable[Concatenate["_FakeSession", P], Awaitable[R]], *args: P.args, **kwargs: P.kwargs
+    ) -> R:
+        self.transactions += 1
+        return await work(self, *args, **kwargs)
+
+    async def run(self, query: str, params: dict[str, Any]) -> _Result:
+        self.calls.append((query, params))
+        return _Result({"stored": len(params["rows"]) - self.short_by})
+
+
+def _repo(session: _FakeSession) -> MemoryRepository:
+    return MemoryRepository(cast(AsyncSession, session))
+
+
+async def test_remember_many_writes_one_batch_per_label_set_in_one_transaction() -> None:
+    session = _FakeSession()
+    memories = [
+        FriendUtterance(content="a"),
+        ClaudeUtterance(content="b"),
+        FriendUtterance(content="c"),
+        SystemNote(content="d"),
+    ]
+
+    stored = await _repo(session).remember_many(memories)
+
+    assert stored == memories
+    assert session.transactions == 1
+    assert len(session.calls) == 3
+    batches = {query.split("MERGE (m:")[1].split(" ")[0]: params["rows"] for query, params in session.calls}
+    assert [row["id"] for row in batches["Memory:FriendUtterance"]] == [str(memories[0].id), str(memories[2].id)]
+    assert [row["id"] for row in batches["Memory:ClaudeUtterance"]] == [str(memories[1].id)]
+    assert batches["Memory:SystemNote"][0]["properties"]["content"] == "d"
+
+
+async def test_remember_many_raises_when_a_batch_is_short() -> None:
+    session = _FakeSession(short_by=1)
+
+    with pytest.raises(ProcessingError):
+        await _repo(session).remember_many([FriendUtterance(content="a"), FriendUtterance(content="b")])
+
+
+async def test_remember_many_with_no_memories_skips_the_database() -> None:
+    session = _FakeSession()
+
+    assert await _repo(session).remember_many([]) == []
+    assert session.transactions == 0
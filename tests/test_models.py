@@ -12,6 +12,7 @@ from memory_palace.domain.models.memories import (
     Memory,
     SystemNote,
 )
+from memory_palace.infrastructure.repositories.memory import MemoryRepository
 
 
 def test_labels_derive_from_memory_type() -> None:
@@ -86,8 +87,28 @@ def test_union_validates_epoch_timestamps_from_neo4j() -> None:
     assert isinstance(memory.id, UUID)
 
 
+def test_batch_union_validation_skips_untyped_nodes_and_keeps_columns() -> None:
+    """recall paths validate a page of nodes at once; legacy nodes drop out."""
+    rows = [
+        {"m": FriendUtterance(content="hi").to_neo4j_properties(), "similarity": 0.9},
+        {"m": {"id": str(uuid4()), "content": "predates the union"}, "similarity": 0.8},
+        {"m": SystemNote(content="note").to_neo4j_properties(), "similarity": 0.5},
+    ]
+
+    validated = MemoryRepository._validate_union_records(rows)
+
+    assert [type(memory) for memory, _ in validated] == [FriendUtterance, SystemNote]
+    assert [record["similarity"] for _, record in validated] == [0.9, 0.5]
+
+
 def test_consolidation_defaults() -> None:
     c = Consolidation(content="distilled")
     assert c.source_ids == []
     assert c.pinned is False
     assert c.period_start is None
+
+
+def test_missing_embedding_is_not_written_back() -> None:
+    # A memory recalled without its vector must not null the stored one on MERGE
+    assert "embedding" not in FriendUtterance(content="recalled").to_neo4j_properties()
+    assert FriendUtterance(content="embedded", embedding=[0.1]).to_neo4j_properties()["embedding"] == [0.1]
@@ -2,7 +2,7 @@
 
 import pytest
 
-from memory_palace.infrastructure.neo4j.queries import DreamJobQueries, MemoryQueries, VectorIndexQueries
+from memory_palace.infrastructure.neo4j.queries import DreamJobQueries, MemoryQueries, QueryFactory, VectorIndexQueries
 
 
 @pytest.mark.parametrize(
@@ -48,3 +48,25 @@ def test_topic_assignment_requires_a_complete_snapshot_match() -> None:
     assert "WHERE size(matched) = size($updates)" in query
     assert "UNWIND matched AS item" in query
     assert params == {}
+
+
+def test_memory_batch_write_is_one_unwind_merge_per_label_set() -> None:
+    query, params = MemoryQueries.store_memory_merge_batch(["Memory", "Consolidation"])
+
+    assert "UNWIND $rows AS row" in query
+    assert "MERGE (m:Memory:Consolidation {id: row.id})" in query
+    assert "RETURN count(m) AS stored" in query
+    assert params == {}
+
+    with pytest.raises(ValueError):
+        MemoryQueries.store_memory_merge_batch(["Memory", "Bad`) MATCH (n) //"])
+
+
+def test_recall_projection_nulls_the_embedding_unless_asked() -> None:
+    recall, _ = QueryFactory.build_filtered_recall(["Memory"], None, limit=10)
+    with_vector, _ = QueryFactory.build_filtered_recall(["Memory"], None, limit=10, include_embedding=True)
+    by_id, _ = MemoryQueries.get_memory_by_id(["Memory"], include_embedding=True)
+
+    assert "RETURN m {.*, embedding: null} AS m" in recall
+    assert "RETURN m AS m" in with_vector
+    assert "RETURN m AS m" in by_id